@@ -5,6 +5,8 @@ The one parameter exponential family distributions used by GLM.
 # see http://www.biostat.jhsph.edu/~qli/biostatistics_r_doc/library/stats/html/family.html
 # for comparison to R, and McCullagh and Nelder
 
+import math
+
 import numpy as np
 from scipy import special
 
@@ -12,6 +14,135 @@ from . import links as L  # noqa N812
 from . import varfuncs as V  # noqa N812
 
 FLOAT_EPS = np.finfo(float).eps
+# floor for logs, guards against zero counts and mu in {0, 1}; a Python float
+# so that it does not upcast float32 arrays
+LOG_TINY = float(np.log(1e-200))
+# scale of the Cox-Snell transform in Binomial.resid_anscombe
+COX_SNELL_SCALE = special.beta(2 / 3.0, 2 / 3.0)
+
+
+def _log_ratio(endog, mu):
+    """
+    Evaluate log(endog / mu) in one buffer, floored at LOG_TINY so that zero
+    counts give a finite value and endog * log(endog / mu) vanishes there.
+    """
+    shape = np.broadcast(endog, mu).shape
+    ratio = np.divide(endog, mu, out=np.empty(shape, np.result_type(endog, mu, 1.0)))
+    with np.errstate(divide="ignore"):
+        np.log(ratio, out=ratio)
+    return np.maximum(ratio, LOG_TINY, out=ratio)
+
+
+def _log_probs(mu):
+    """
+    Evaluate log(mu) and log(1 - mu), floored at LOG_TINY. log1p keeps
+    log(1 - mu) accurate for small mu.
+    """
+    with np.errstate(divide="ignore"):
+        log_mu = np.maximum(np.log(mu), LOG_TINY)
+        log1m_mu = np.maximum(np.log1p(-mu), LOG_TINY)
+    return log_mu, log1m_mu
+
+
+def _log_bernoulli(endog, mu):
+    """
+    Evaluate log(mu) where endog == 1 and log(1 - mu) elsewhere, floored at
+    LOG_TINY. mu or 1 - mu is selected first, so only one log is taken.
+    """
+    shape = np.broadcast(endog, mu).shape
+    prob = np.subtract(1, mu, out=np.empty(shape, np.result_type(mu, 1.0)))
+    np.copyto(prob, mu, where=np.equal(endog, 1))
+    with np.errstate(divide="ignore"):
+        np.log(prob, out=prob)
+    return np.maximum(prob, LOG_TINY, out=prob)
+
+
+def _log_factorial(y):
+    """
+    Evaluate log(y!). Counts are gathered from a table of log-factorials up to
+    max(y) when that table is shorter than y, instead of calling gammaln once
+    per observation.
+    """
+    y = np.asarray(y)
+    if y.size and y.dtype.kind in "iuf":
+        with np.errstate(invalid="ignore"):
+            k = y.astype(np.intp)
+        kmin, kmax = k.min(), k.max()
+        if kmin >= 0 and kmax < y.size and np.array_equal(k, y):
+            table = np.arange(1, kmax + 2, dtype=np.result_type(y, 1.0))
+            return special.gammaln(table, out=table)[k]
+    return special.gammaln(y + 1)
+
+
+def _log_binom_coef(endog, n):
+    """
+    Evaluate log(n choose endog * n). Integer counts gather their
+    log-factorials from a table, see _log_factorial.
+    """
+    y = endog * n  # convert back to successes
+    # undo the rounding of endog = successes / n, so that integer counts are
+    # recognized as such
+    k = np.rint(y)
+    if np.allclose(y, k, rtol=1e-12, atol=0):
+        y = k
+    coef = _log_factorial(n) - _log_factorial(y)
+    coef -= _log_factorial(n - y)
+    return coef
+
+
+def _weighted_sum(values, freq_weights, axis=None):
+    """
+    Sum values * freq_weights over `axis`. A weight vector matching a 1d
+    `values` (or a column of weights for a 2d one, summed over axis 0) is
+    contracted with a single dot product instead of a multiply and a sum.
+    Scalar weights, such as the default of 1, scale the sum rather than each
+    term. Otherwise `values` is weighted in place, so it must be a scratch
+    array.
+    """
+    ndim, fw_shape = np.ndim(values), np.shape(freq_weights)
+    if fw_shape == ():
+        return freq_weights * np.sum(values, axis=axis)
+    if ndim == 1 and axis in (None, 0) and fw_shape == np.shape(values):
+        return np.dot(values, freq_weights)
+    if ndim == 2 and axis == 0 and fw_shape == (len(values), 1):
+        return np.dot(np.ravel(freq_weights), values)
+    dtype = np.result_type(values, freq_weights)
+    if dtype == np.result_type(values):
+        values *= freq_weights
+    else:
+        # integer terms with float weights cannot be weighted in place
+        values = np.multiply(values, freq_weights, dtype=dtype)
+    return np.sum(values, axis=axis)
+
+
+def _weighted_sum_sq(resid, freq_weights, axis=None):
+    """
+    Sum resid**2 * freq_weights over `axis`. Scalar weights, and a weight
+    vector matching a 1d `resid`, are contracted without materializing the
+    squares; otherwise `resid` is squared in place, so it must be a scratch
+    array.
+    """
+    fw_shape = np.shape(freq_weights)
+    if fw_shape == ():
+        if axis is None:
+            return freq_weights * np.vdot(resid, resid)
+        if axis == 0:
+            return freq_weights * np.einsum("i...,i...->...", resid, resid)
+    elif np.ndim(resid) == 1 and axis in (None, 0) and fw_shape == resid.shape:
+        return np.einsum("i,i,i->", resid, resid, freq_weights)
+    resid *= resid
+    return _weighted_sum(resid, freq_weights, axis)
+
+
+def _signed_sqrt(dev, resid):
+    """
+    Turn the unit deviances `dev` into deviance residuals in place, taking
+    the sign of `resid`. Round-off below zero is trimmed to avoid NaNs.
+    """
+    out = dev if isinstance(dev, np.ndarray) else None
+    dev = np.maximum(dev, 0.0, out=out)
+    dev = np.sqrt(dev, out=out)
+    return np.copysign(dev, resid, out=out)
 
 
 class Family:
@@ -58,12 +189,9 @@ class Family:
         self._link = link
         if not isinstance(link, L.Link):
             raise TypeError("The input should be a valid Link object.")
-        if hasattr(self, "links"):
-            validlink = link in self.links
-            validlink = max([isinstance(link, _) for _ in self.links])
-            if not validlink:
-                errmsg = "Invalid link for family, should be in %s. (got %s)"
-                raise ValueError(errmsg % (repr(self.links), link))
+        if hasattr(self, "links") and not isinstance(link, tuple(self.links)):
+            errmsg = "Invalid link for family, should be in %s. (got %s)"
+            raise ValueError(errmsg % (repr(self.links), link))
 
     def _getlink(self):
         """
@@ -74,6 +202,13 @@ class Family:
     # link property for each family is a pointer to link instance
     link = property(_getlink, _setlink, doc="Link function for family")
 
+    @property
+    def is_canonical_link(self):
+        """
+        Whether the link of the family is its canonical link.
+        """
+        return False
+
     def __init__(self, link, variance):
         self.link = link()
         self.variance = variance
@@ -93,7 +228,9 @@ class Family:
             The first guess on the transformed response variable.
 
         """
-        return (y + y.mean()) / 2.0
+        mu_0 = y + y.mean(axis=0, keepdims=True)
+        mu_0 *= 0.5
+        return mu_0
 
     def weights(self, mu):
         r"""
@@ -110,9 +247,16 @@ class Family:
             The weights for the IRLS steps
 
         """
-        return 1.0 / (self.link.deriv(mu) ** 2 * self.variance(mu))
-
-    def deviance(self, endog, mu, freq_weights=1.0, scale=1.0):
+        if self.is_canonical_link:
+            # g'(mu) == 1 / V(mu) for the canonical link
+            return self.variance(mu)
+        w = np.square(self.link.deriv(mu))
+        w *= self.variance(mu)
+        if isinstance(w, np.ndarray):
+            return np.reciprocal(w, out=w)
+        return 1.0 / w
+
+    def deviance(self, endog, mu, freq_weights=1.0, scale=1.0, axis=None):
         r"""
         The deviance function evaluated at (endog,mu,freq_weights,mu).
 
@@ -128,6 +272,10 @@ class Family:
             1d array of frequency weights. The default is 1.
         scale : float, optional
             An optional scale argument. The default is 1.
+        axis : int, optional
+            Axis along which the deviance is summed. The default, None, sums over
+            all elements; axis=0 gives one value per column of a 2d `endog`
+            holding several responses.
 
         Returns
         -------
@@ -196,7 +344,7 @@ class Family:
         """
         return self.link(mu)
 
-    def loglike(self, endog, mu, freq_weights=1.0, scale=1.0):
+    def loglike(self, endog, mu, freq_weights=1.0, scale=1.0, axis=None):
         """
         The log-likelihood function in terms of the fitted mean response.
 
@@ -210,6 +358,10 @@ class Family:
             1d array of frequency weights. The default is 1.
         scale : float
             The scale parameter. The default is 1.
+        axis : int, optional
+            Axis along which the loglikelihood is summed. The default, None,
+            sums over all elements; axis=0 gives one value per column of a 2d
+            `endog` holding several responses.
 
         Returns
         -------
@@ -261,12 +413,12 @@ class Poisson(Family):
         self.variance = Poisson.variance
         self.link = link()
 
-    def _clean(self, x):
+    @property
+    def is_canonical_link(self):
         """
-        Helper function to trim the data so that is in (0,inf)
-
+        Whether the link is the canonical log link.
         """
-        return np.clip(x, FLOAT_EPS, np.inf)
+        return isinstance(self.link, L.Log)
 
     def resid_dev(self, endog, mu, scale=1.0):
         r"""Poisson deviance residual
@@ -287,14 +439,15 @@ class Poisson(Family):
             Deviance residuals as defined below
 
         """
-        endog_mu = self._clean(endog / mu)
-        return (
-            np.sign(endog - mu)
-            * np.sqrt(2 * (endog * np.log(endog_mu) - (endog - mu)))
-            / scale
-        )
-
-    def deviance(self, endog, mu, freq_weights=1.0, scale=1.0):
+        resid = endog - mu
+        dev = endog * _log_ratio(endog, mu)
+        dev -= resid
+        dev *= 2
+        dev = _signed_sqrt(dev, resid)
+        dev /= scale
+        return dev
+
+    def deviance(self, endog, mu, freq_weights=1.0, scale=1.0, axis=None):
         r"""
         Poisson deviance function
 
@@ -308,6 +461,10 @@ class Poisson(Family):
             1d array of frequency weights. The default is 1.
         scale : float, optional
             An optional scale argument. The default is 1.
+        axis : int, optional
+            Axis along which the deviance is summed. The default, None, sums over
+            all elements; axis=0 gives one value per column of a 2d `endog`
+            holding several responses.
 
         Returns
         -------
@@ -316,10 +473,10 @@ class Poisson(Family):
             below.
 
         """
-        endog_mu = self._clean(endog / mu)
-        return 2 * np.sum(endog * freq_weights * np.log(endog_mu)) / scale
+        dev = endog * _log_ratio(endog, mu)
+        return 2 * _weighted_sum(dev, freq_weights, axis) / scale
 
-    def loglike(self, endog, mu, freq_weights=1.0, scale=1.0):
+    def loglike(self, endog, mu, freq_weights=1.0, scale=1.0, axis=None):
         r"""
         The log-likelihood function in terms of the fitted mean response.
 
@@ -333,6 +490,10 @@ class Poisson(Family):
             1d array of frequency weights. The default is 1.
         scale : float, optional
             The scale parameter, defaults to 1.
+        axis : int, optional
+            Axis along which the loglikelihood is summed. The default, None,
+            sums over all elements; axis=0 gives one value per column of a 2d
+            `endog` holding several responses.
 
         Returns
         -------
@@ -341,10 +502,10 @@ class Poisson(Family):
             (endog,mu,freq_weights,scale) as defined below.
 
         """
-        loglike = np.sum(
-            freq_weights * (endog * np.log(mu) - mu - special.gammaln(endog + 1))
-        )
-        return scale * loglike
+        loglike = endog * np.log(mu)
+        loglike -= mu
+        loglike -= _log_factorial(endog)
+        return scale * _weighted_sum(loglike, freq_weights, axis)
 
     def resid_anscombe(self, endog, mu):
         r"""
@@ -363,7 +524,16 @@ class Poisson(Family):
             The Anscome residuals for the Poisson family defined below
 
         """
-        return (3 / 2.0) * (endog ** (2 / 3.0) - mu ** (2 / 3.0)) / mu ** (1 / 6.0)
+        cbrt_endog = np.cbrt(endog)
+        cbrt_mu = np.cbrt(mu)
+        # endog**(2/3) - mu**(2/3) as a difference of squares, in place
+        resid = cbrt_endog - cbrt_mu
+        cbrt_endog += cbrt_mu
+        resid *= cbrt_endog
+        # mu**(1/6) == sqrt(cbrt(mu))
+        resid /= np.sqrt(cbrt_mu)
+        resid *= 1.5
+        return resid
 
 
 class QuasiPoisson(Family):
@@ -396,12 +566,12 @@ class QuasiPoisson(Family):
         self.variance = Poisson.variance
         self.link = link()
 
-    def _clean(self, x):
+    @property
+    def is_canonical_link(self):
         """
-        Helper function to trim the data so that is in (0,inf)
-
+        Whether the link is the canonical log link.
         """
-        return np.clip(x, FLOAT_EPS, np.inf)
+        return isinstance(self.link, L.Log)
 
     def resid_dev(self, endog, mu, scale=1.0):
         r"""Poisson deviance residual
@@ -422,14 +592,15 @@ class QuasiPoisson(Family):
             Deviance residuals as defined below
 
         """
-        endog_mu = self._clean(endog / mu)
-        return (
-            np.sign(endog - mu)
-            * np.sqrt(2 * (endog * np.log(endog_mu) - (endog - mu)))
-            / scale
-        )
-
-    def deviance(self, endog, mu, freq_weights=1.0, scale=1.0):
+        resid = endog - mu
+        dev = endog * _log_ratio(endog, mu)
+        dev -= resid
+        dev *= 2
+        dev = _signed_sqrt(dev, resid)
+        dev /= scale
+        return dev
+
+    def deviance(self, endog, mu, freq_weights=1.0, scale=1.0, axis=None):
         r"""
         Poisson deviance function
 
@@ -443,6 +614,10 @@ class QuasiPoisson(Family):
             1d array of frequency weights. The default is 1.
         scale : float, optional
             An optional scale argument. The default is 1.
+        axis : int, optional
+            Axis along which the deviance is summed. The default, None, sums over
+            all elements; axis=0 gives one value per column of a 2d `endog`
+            holding several responses.
 
         Returns
         -------
@@ -451,10 +626,10 @@ class QuasiPoisson(Family):
             below.
 
         """
-        endog_mu = self._clean(endog / mu)
-        return 2 * np.sum(endog * freq_weights * np.log(endog_mu)) / scale
+        dev = endog * _log_ratio(endog, mu)
+        return 2 * _weighted_sum(dev, freq_weights, axis) / scale
 
-    def loglike(self, endog, mu, freq_weights=1.0, scale=1.0):  # noqa ARG002
+    def loglike(self, endog, mu, freq_weights=1.0, scale=1.0, axis=None):  # noqa ARG002
         r"""
         The log-likelihood function in terms of the fitted mean response.
 
@@ -483,7 +658,16 @@ class QuasiPoisson(Family):
             The Anscome residuals for the Poisson family defined below
 
         """
-        return (3 / 2.0) * (endog ** (2 / 3.0) - mu ** (2 / 3.0)) / mu ** (1 / 6.0)
+        cbrt_endog = np.cbrt(endog)
+        cbrt_mu = np.cbrt(mu)
+        # endog**(2/3) - mu**(2/3) as a difference of squares, in place
+        resid = cbrt_endog - cbrt_mu
+        cbrt_endog += cbrt_mu
+        resid *= cbrt_endog
+        # mu**(1/6) == sqrt(cbrt(mu))
+        resid /= np.sqrt(cbrt_mu)
+        resid *= 1.5
+        return resid
 
 
 class Gaussian(Family):
@@ -512,6 +696,13 @@ class Gaussian(Family):
         self.variance = Gaussian.variance
         self.link = link()
 
+    @property
+    def is_canonical_link(self):
+        """
+        Whether the link is the canonical identity link.
+        """
+        return isinstance(self.link, L.Power) and self.link.power == 1
+
     def resid_dev(self, endog, mu, scale=1.0):
         """
         Gaussian deviance residuals
@@ -533,9 +724,12 @@ class Gaussian(Family):
 
         """
 
-        return (endog - mu) / np.sqrt(self.variance(mu)) / scale
+        resid = np.subtract(endog, mu, dtype=np.result_type(endog, mu, 1.0))
+        resid /= np.sqrt(self.variance(mu))
+        resid /= scale
+        return resid
 
-    def deviance(self, endog, mu, freq_weights=1.0, scale=1.0):
+    def deviance(self, endog, mu, freq_weights=1.0, scale=1.0, axis=None):
         """
         Gaussian deviance function
 
@@ -549,6 +743,10 @@ class Gaussian(Family):
             1d array of frequency weights. The default is 1.
         scale : float, optional
             An optional scale argument. The default is 1.
+        axis : int, optional
+            Axis along which the deviance is summed. The default, None, sums over
+            all elements; axis=0 gives one value per column of a 2d `endog`
+            holding several responses.
 
         Returns
         -------
@@ -557,9 +755,10 @@ class Gaussian(Family):
             as defined below.
 
         """
-        return np.sum(freq_weights * (endog - mu) ** 2) / scale
+        resid = endog - mu
+        return _weighted_sum_sq(resid, freq_weights, axis) / scale
 
-    def loglike(self, endog, mu, freq_weights=1.0, scale=1.0):
+    def loglike(self, endog, mu, freq_weights=1.0, scale=1.0, axis=None):
         """
         The log-likelihood in terms of the fitted mean response.
 
@@ -573,6 +772,10 @@ class Gaussian(Family):
             1d array of frequency weights. The default is 1.
         scale : float, optional
             Scales the loglikelihood function. The default is 1.
+        axis : int, optional
+            Axis along which the loglikelihood is summed. The default, None,
+            sums over all elements; axis=0 gives one value per column of a 2d
+            `endog` holding several responses.
 
         Returns
         -------
@@ -581,22 +784,29 @@ class Gaussian(Family):
             (endog,mu,freq_weights,scale) as defined below.
 
         """
-        if isinstance(self.link, L.Power) and self.link.power == 1:
+        if self.is_canonical_link:
             # This is just the loglikelihood for classical OLS
             nobs2 = endog.shape[0] / 2.0
-            SSR = np.sum((endog - self.fitted(mu)) ** 2, axis=0)
+            resid = endog - self.fitted(mu)
+            SSR = np.einsum("i...,i...->...", resid, resid)
             llf = -np.log(SSR) * nobs2
-            llf -= (1 + np.log(np.pi / nobs2)) * nobs2
+            llf -= (1 + math.log(np.pi / nobs2)) * nobs2
             return llf
         else:
-            return np.sum(
-                freq_weights
-                * (
-                    (endog * mu - mu**2 / 2) / scale
-                    - endog**2 / (2 * scale)
-                    - 0.5 * np.log(2 * np.pi * scale)
-                )
-            )
+            # endog * mu - mu**2 / 2 - endog**2 / 2 == -(endog - mu)**2 / 2
+            resid = endog - mu
+            if np.ndim(freq_weights) == 0:
+                count = resid.size if axis is None else resid.shape[axis]
+                nobs = freq_weights * count
+            else:
+                nobs = np.sum(np.broadcast_to(freq_weights, resid.shape), axis=axis)
+            llf = -_weighted_sum_sq(resid, freq_weights, axis) / (2 * scale)
+            if np.ndim(scale):
+                log_2pi_scale = np.log(2 * np.pi * scale)
+            else:
+                log_2pi_scale = math.log(2 * np.pi * scale)
+            llf -= 0.5 * log_2pi_scale * nobs
+            return llf
 
     def resid_anscombe(self, endog, mu):
         """
@@ -646,14 +856,25 @@ class Gamma(Family):
         self.variance = Gamma.variance
         self.link = link()
 
-    def _clean(self, x):
+    @property
+    def is_canonical_link(self):
         """
-        Helper function to trim the data so that is in (0,inf)
-
+        Whether the link is the canonical inverse power link.
         """
-        return np.clip(x, FLOAT_EPS, np.inf)
+        return isinstance(self.link, L.Power) and self.link.power == -1
 
-    def deviance(self, endog, mu, freq_weights=1.0, scale=1.0):  # noqa ARG002
+    def _dev_terms(self, endog, mu):
+        """
+        Unit deviances (endog - mu)/mu - log(endog/mu), computed in one buffer.
+        """
+        dev = np.subtract(endog, mu, dtype=np.result_type(endog, mu, 1.0))
+        dev /= mu
+        dev -= _log_ratio(endog, mu)
+        return dev
+
+    def deviance(
+        self, endog, mu, freq_weights=1.0, scale=1.0, axis=None  # noqa ARG002
+    ):
         r"""
         Gamma deviance function
 
@@ -667,6 +888,10 @@ class Gamma(Family):
             1d array of frequency weights. The default is 1.
         scale : float, optional
             An optional scale argument. The default is 1.
+        axis : int, optional
+            Axis along which the deviance is summed. The default, None, sums over
+            all elements; axis=0 gives one value per column of a 2d `endog`
+            holding several responses.
 
         Returns
         -------
@@ -674,8 +899,8 @@ class Gamma(Family):
             Deviance function as defined below
 
         """
-        endog_mu = self._clean(endog / mu)
-        return 2 * np.sum(freq_weights * ((endog - mu) / mu - np.log(endog_mu)))
+        dev = self._dev_terms(endog, mu)
+        return 2 * _weighted_sum(dev, freq_weights, axis)
 
     def resid_dev(self, endog, mu, scale=1.0):  # noqa ARG002
         r"""
@@ -697,12 +922,11 @@ class Gamma(Family):
             Deviance residuals as defined below
 
         """
-        endog_mu = self._clean(endog / mu)
-        return np.sign(endog - mu) * np.sqrt(
-            -2 * (-(endog - mu) / mu + np.log(endog_mu))
-        )
+        dev = self._dev_terms(endog, mu)
+        dev *= 2
+        return _signed_sqrt(dev, endog - mu)
 
-    def loglike(self, endog, mu, freq_weights=1.0, scale=1.0):
+    def loglike(self, endog, mu, freq_weights=1.0, scale=1.0, axis=None):
         r"""
         The log-likelihood function in terms of the fitted mean response.
 
@@ -716,6 +940,10 @@ class Gamma(Family):
             1d array of frequency weights. The default is 1.
         scale : float, optional
             The default is 1.
+        axis : int, optional
+            Axis along which the loglikelihood is summed. The default, None,
+            sums over all elements; axis=0 gives one value per column of a 2d
+            `endog` holding several responses.
 
         Returns
         -------
@@ -724,20 +952,18 @@ class Gamma(Family):
             (endog,mu,freq_weights,scale) as defined below.
 
         """
-        return (
-            -1.0
-            / scale
-            * np.sum(
-                (
-                    endog / mu
-                    + np.log(mu)
-                    + (scale - 1) * np.log(endog)
-                    + np.log(scale)
-                    + scale * special.gammaln(1.0 / scale)
-                )
-                * freq_weights
-            )
-        )
+        llf = endog / mu
+        llf += np.log(mu)
+        # the term vanishes for the common scalar scale of 1
+        if np.ndim(scale) or scale != 1:
+            llf += (scale - 1) * np.log(endog)
+        # the remaining terms do not depend on the observations, so a scalar
+        # scale is evaluated with the math functions
+        if np.ndim(scale):
+            llf += np.log(scale) + scale * special.gammaln(1.0 / scale)
+        else:
+            llf += math.log(scale) + scale * math.lgamma(1.0 / scale)
+        return -1.0 / scale * _weighted_sum(llf, freq_weights, axis)
 
         # in Stata scale is set to equal 1 for reporting llf
         # in R it's the dispersion, though there is a loss of precision vs.
@@ -760,7 +986,17 @@ class Gamma(Family):
             The Anscombe residuals for the Gamma family defined below
 
         """
-        return 3 * (endog ** (1 / 3.0) - mu ** (1 / 3.0)) / mu ** (1 / 3.0)
+        cbrt_mu = np.cbrt(mu)
+        resid = np.cbrt(endog)
+        resid -= cbrt_mu
+        resid /= cbrt_mu
+        resid *= 3
+        # unlike the fractional power, cbrt is finite for negative values, so
+        # keep the residuals undefined there (e.g. mu < 0 under identity link)
+        negative = np.less(endog, 0) | np.less(mu, 0)
+        if np.any(negative):
+            resid = np.where(negative, np.nan, resid)
+        return resid
 
 
 class Binomial(Family):
@@ -797,12 +1033,37 @@ class Binomial(Family):
         self.variance = V.Binomial(n=self.n)
         self.link = link()
 
+    @property
+    def is_canonical_link(self):
+        """
+        Whether the link is the canonical logit link.
+        """
+        return type(self.link) in (L.Logit, L.logit)
+
+    def _setn(self, n):
+        """
+        Helper method to set the number of trials, recording once per `n`
+        whether the Bernoulli formulas apply.
+        """
+        self._n = n
+        self._bernoulli = np.shape(n) == () and n == 1
+
+    def _getn(self):
+        """
+        Helper method to get the number of trials.
+        """
+        return self._n
+
+    n = property(_getn, _setn, doc="Number of trials per observation")
+
     def starting_mu(self, y):
         r"""
         The starting values for the IRLS algorithm for the Binomial family.
         A good choice for the binomial family is :math:`\mu_0 = (Y_i + 0.5)/2`
         """
-        return (y + 0.5) / 2
+        mu_0 = y + 0.5
+        mu_0 *= 0.5
+        return mu_0
 
     def initialize(self, endog, freq_weights):  # noqa ARG002
         """
@@ -847,6 +1108,10 @@ class Binomial(Family):
             1d array of frequency weights. The default is 1.
         scale : float, optional
             An optional scale argument. The default is 1.
+        axis : int, optional
+            Axis along which the deviance is summed. The default, None, sums over
+            all elements; axis=0 gives one value per column of a 2d `endog`
+            holding several responses.
 
         Returns
         --------
@@ -854,24 +1119,38 @@ class Binomial(Family):
             The deviance function as defined below
 
         """
-        if np.shape(self.n) == () and self.n == 1:
-            one = np.equal(endog, 1)
-            return -2 * np.sum(
-                (one * np.log(mu + 1e-200) + (1 - one) * np.log(1 - mu + 1e-200))
-                * freq_weights,
-                axis=axis,
-            )
-
+        if self._bernoulli:
+            return self._deviance_bernoulli(endog, mu, freq_weights, scale, axis)
         else:
-            return 2 * np.sum(
-                self.n
-                * freq_weights
-                * (
-                    endog * np.log(endog / mu + 1e-200)
-                    + (1 - endog) * np.log((1 - endog) / (1 - mu) + 1e-200)
-                ),
-                axis=axis,
-            )
+            return self._deviance_binomial(endog, mu, freq_weights, scale, axis)
+
+    def _deviance_bernoulli(
+        self, endog, mu, freq_weights=1, scale=1.0, axis=None  # noqa ARG002
+    ):
+        dev = _log_bernoulli(endog, mu)
+        return -2 * _weighted_sum(dev, freq_weights, axis)
+
+    def _deviance_binomial(
+        self, endog, mu, freq_weights=1, scale=1.0, axis=None  # noqa ARG002
+    ):
+        dev = self._dev_terms(endog, mu)
+        dev *= self.n
+        return 2 * _weighted_sum(dev, freq_weights, axis)
+
+    def _dev_terms(self, endog, mu):
+        """
+        Binomial unit deviances (divided by 2n),
+        endog * log(endog / mu) + (1 - endog) * log((1 - endog) / (1 - mu)),
+        with two logs. _log_ratio floors the logs, so the 0 * log(0) terms at
+        endog in {0, 1} vanish.
+        """
+        dev = _log_ratio(endog, mu)
+        dev *= endog
+        failures = 1 - endog
+        log_failures = _log_ratio(failures, 1 - mu)
+        log_failures *= failures
+        dev += log_failures
+        return dev
 
     def resid_dev(self, endog, mu, scale=1.0):
         r"""
@@ -894,29 +1173,25 @@ class Binomial(Family):
 
         """
 
-        mu = self.link._clean(mu)
-        if np.shape(self.n) == () and self.n == 1:
-            one = np.equal(endog, 1)
-            return (
-                np.sign(endog - mu)
-                * np.sqrt(-2 * np.log(one * mu + (1 - one) * (1 - mu)))
-                / scale
-            )
+        if self._bernoulli:
+            return self._resid_dev_bernoulli(endog, mu, scale)
         else:
-            return (
-                np.sign(endog - mu)
-                * np.sqrt(
-                    2
-                    * self.n
-                    * (
-                        endog * np.log(endog / mu + 1e-200)
-                        + (1 - endog) * np.log((1 - endog) / (1 - mu) + 1e-200)
-                    )
-                )
-                / scale
-            )
-
-    def loglike(self, endog, mu, freq_weights=1, scale=1.0):
+            return self._resid_dev_binomial(endog, mu, scale)
+
+    def _resid_dev_bernoulli(self, endog, mu, scale=1.0):
+        dev = _log_bernoulli(endog, mu)
+        dev *= -2
+        dev = _signed_sqrt(dev, endog - mu)
+        dev /= scale
+        return dev
+
+    def _resid_dev_binomial(self, endog, mu, scale=1.0):
+        dev = 2 * self.n * self._dev_terms(endog, mu)
+        dev = _signed_sqrt(dev, endog - mu)
+        dev /= scale
+        return dev
+
+    def loglike(self, endog, mu, freq_weights=1, scale=1.0, axis=None):
         r"""
         The log-likelihood function in terms of the fitted mean response.
 
@@ -930,6 +1205,10 @@ class Binomial(Family):
             1d array of frequency weights. The default is 1.
         scale : float, optional
             Not used for the Binomial GLM.
+        axis : int, optional
+            Axis along which the loglikelihood is summed. The default, None,
+            sums over all elements; axis=0 gives one value per column of a 2d
+            `endog` holding several responses.
 
         Returns
         -------
@@ -939,22 +1218,28 @@ class Binomial(Family):
 
         """
 
-        if np.shape(self.n) == () and self.n == 1:
-            return scale * np.sum(
-                (endog * np.log(mu / (1 - mu) + 1e-200) + np.log(1 - mu)) * freq_weights
-            )
+        if self._bernoulli:
+            return self._loglike_bernoulli(endog, mu, freq_weights, scale, axis)
         else:
-            y = endog * self.n  # convert back to successes
-            return scale * np.sum(
-                (
-                    special.gammaln(self.n + 1)
-                    - special.gammaln(y + 1)
-                    - special.gammaln(self.n - y + 1)
-                    + y * np.log(mu / (1 - mu))
-                    + self.n * np.log(1 - mu)
-                )
-                * freq_weights
-            )
+            return self._loglike_binomial(endog, mu, freq_weights, scale, axis)
+
+    def _loglike_bernoulli(self, endog, mu, freq_weights=1, scale=1.0, axis=None):
+        log_mu, log1m_mu = _log_probs(mu)
+        # endog * log(mu / (1 - mu)) + log(1 - mu), with the logit taken as
+        # log(mu) - log(1 - mu) from the floored logs
+        llf = log_mu - log1m_mu
+        llf *= endog
+        llf += log1m_mu
+        return scale * _weighted_sum(llf, freq_weights, axis)
+
+    def _loglike_binomial(self, endog, mu, freq_weights=1, scale=1.0, axis=None):
+        log_mu, log1m_mu = _log_probs(mu)
+        y = endog * self.n  # convert back to successes
+        # y * log(mu / (1 - mu)) + n * log(1 - mu) in a single buffer
+        llf = y * log_mu
+        llf += (self.n - y) * log1m_mu
+        llf += _log_binom_coef(endog, self.n)
+        return scale * _weighted_sum(llf, freq_weights, axis)
 
     def resid_anscombe(self, endog, mu):
         """
@@ -981,10 +1266,9 @@ class Binomial(Family):
             Journal of the Royal Statistical Society B. 30, 248-75.
 
         """
-        cox_snell = lambda x: (  # noqa E731 - skip "don't use lambda"
-            special.betainc(2 / 3.0, 2 / 3.0, x) * special.beta(2 / 3.0, 2 / 3.0)
-        )
-        return np.sqrt(self.n) * (
-            (cox_snell(endog) - cox_snell(mu))
-            / (mu ** (1 / 6.0) * (1 - mu) ** (1 / 6.0))
-        )
+        resid = special.betainc(2 / 3.0, 2 / 3.0, endog)
+        resid -= special.betainc(2 / 3.0, 2 / 3.0, mu)
+        # mu**(1/6) * (1 - mu)**(1/6) == sqrt(cbrt(mu * (1 - mu)))
+        resid /= np.sqrt(np.cbrt(mu * (1 - mu)))
+        resid *= COX_SNELL_SCALE * np.sqrt(self.n)
+        return resid
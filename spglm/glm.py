@@ -317,7 +317,7 @@ class GLMResults(LikelihoodModelResults):
 
     @cache_readonly
     def resid_pearson(self):
-        return (self.y - self.mu) / np.sqrt(self.family.variance(self.mu))
+        return self.resid_response / np.sqrt(self.family.variance(self.mu))
 
     @cache_readonly
     def resid_working(self):
@@ -333,7 +333,7 @@ class GLMResults(LikelihoodModelResults):
 
     @cache_readonly
     def pearson_chi2(self):
-        chisq = (self.y - self.mu) ** 2 / self.family.variance(self.mu)
+        chisq = np.square(self.resid_response) / self.family.variance(self.mu)
         chisqsum = np.sum(chisq)
         return chisqsum
 
@@ -350,9 +350,7 @@ class GLMResults(LikelihoodModelResults):
         if isinstance(self.family, (family.Binomial, family.Poisson)):
             return 1.0
         else:
-            return (
-                np.power(self.resid_response, 2) / self.family.variance(self.mu)
-            ).sum() / (self.df_resid)
+            return self.pearson_chi2 / self.df_resid
 
     @cache_readonly
     def deviance(self):
@@ -274,7 +274,9 @@ class Power(Link):
         g(p) = x**self.power
         """
 
-        z = np.power(p, self.power)
+        # the ** operator dispatches the common exponents (2, 0.5, -1, ...)
+        # to square, sqrt and reciprocal instead of the generic power loop
+        z = np.asarray(p) ** self.power
         return z
 
     def inverse(self, z):
@@ -296,7 +298,7 @@ class Power(Link):
         g^(-1)(z`) = `z`**(1/`power`)
         """
 
-        p = np.power(z, 1.0 / self.power)
+        p = np.asarray(z) ** (1.0 / self.power)
         return p
 
     def deriv(self, p):
@@ -428,7 +430,7 @@ class Log(Link):
     """
 
     def _clean(self, x):
-        return np.clip(x, FLOAT_EPS, np.inf)
+        return np.maximum(x, FLOAT_EPS)
 
     def __call__(self, p):
         """
@@ -845,7 +847,7 @@ class NegativeBinomial:
         self.alpha = alpha
 
     def _clean(self, x):
-        return np.clip(x, FLOAT_EPS, np.inf)
+        return np.maximum(x, FLOAT_EPS)
 
     def __call__(self, p):
         """
@@ -866,7 +868,8 @@ class NegativeBinomial:
         g(p) = log(p/(p + 1/alpha))
         """
         p = self._clean(p)
-        return np.log(p / (p + 1 / self.alpha))
+        # log(p / (p + 1/alpha)) == -log(1 + 1/(alpha*p)), exact for large p
+        return -np.log1p(1 / (self.alpha * p))
 
     def inverse(self, z):
         """
@@ -886,7 +889,7 @@ class NegativeBinomial:
         -----
         g^(-1)(z) = exp(z)/(alpha*(1-exp(z)))
         """
-        return -1 / (self.alpha * (1 - np.exp(-z)))
+        return 1 / (self.alpha * np.expm1(-z))
 
     def deriv(self, p):
         """
@@ -10,8 +10,18 @@ __author__ = "Taylor Oshan tayoshan@gmail.com"
 import libpysal
 import numpy
 import pytest
+from scipy import special, stats
 
-from ..family import Binomial, Gaussian, Poisson, QuasiPoisson
+from .. import links
+from ..family import (
+    Binomial,
+    Gamma,
+    Gaussian,
+    Poisson,
+    QuasiPoisson,
+    _log_binom_coef,
+    _log_factorial,
+)
 from ..glm import GLM
 
 
@@ -4265,3 +4275,176 @@ class TestBinomial:
         )
         assert pytest.approx(results.D2) == 0.200712816165
         assert pytest.approx(results.adj_D2) == 0.19816731557930456
+
+
+class TestFamily:
+    """
+    Tests for the family helpers
+    """
+
+    def setup_method(self):
+        self.p = numpy.linspace(0.05, 0.95, 19)
+        self.rng = numpy.random.default_rng(0)
+        self.y = self.rng.poisson(3, (50, 3)) + 1.0
+        self.mu = self.rng.gamma(3, 1, (50, 3))
+
+    def test_canonical_weights(self):
+        for fam, link in [
+            (Poisson, links.log),
+            (Gaussian, links.identity),
+            (Gamma, links.inverse_power),
+            (Binomial, links.logit),
+        ]:
+            canonical = fam(link)
+            assert canonical.is_canonical_link
+            w = 1.0 / (canonical.link.deriv(self.p) ** 2 * canonical.variance(self.p))
+            numpy.testing.assert_allclose(canonical.weights(self.p), w)
+        assert not Poisson(links.sqrt).is_canonical_link
+        assert not Binomial(links.probit).is_canonical_link
+
+    def test_axis(self):
+        y, mu = self.y, self.mu
+        for fam in [Poisson(), Gamma(), Gaussian()]:
+            dev = fam.deviance(y, mu, axis=0)
+            llf = fam.loglike(y, mu, axis=0)
+            for j in range(3):
+                assert pytest.approx(dev[j]) == fam.deviance(y[:, j], mu[:, j])
+                assert pytest.approx(llf[j]) == fam.loglike(y[:, j], mu[:, j])
+
+    def test_float32(self):
+        y = self.y[:, 0].astype(numpy.float32)
+        mu = self.mu[:, 0].astype(numpy.float32)
+        yb = (y > 3).astype(numpy.float32)
+        p = self.p.astype(numpy.float32)[self.rng.integers(0, 19, 50)]
+        for fam, endog, mean in [
+            (Poisson(), y, mu),
+            (Gamma(), y, mu),
+            (Binomial(), yb, p),
+        ]:
+            resid = fam.resid_dev(endog, mean)
+            assert resid.dtype == numpy.float32
+            numpy.testing.assert_allclose(
+                resid,
+                fam.resid_dev(endog.astype(float), mean.astype(float)),
+                rtol=1e-4,
+                atol=1e-4,
+            )
+            assert fam.deviance(endog, mean).dtype == numpy.float32
+
+    def test_log_factorial(self):
+        counts = self.rng.poisson(3, (50, 2))
+        for y in [counts, counts.astype(float), numpy.array([0.5, 1.0, 2.5])]:
+            numpy.testing.assert_allclose(_log_factorial(y), special.gammaln(y + 1))
+
+    def test_log_binom_coef(self):
+        def gammaln_coef(y, n):
+            coef = special.gammaln(n + 1) - special.gammaln(y + 1)
+            return coef - special.gammaln(n - y + 1)
+
+        n = numpy.array([3.0, 22.0, 25.0, 4.0])
+        # 15/22 * 22 and 7/25 * 25 do not round-trip to integers in binary
+        successes = numpy.array([1.0, 15.0, 7.0, 4.0])
+        assert not numpy.array_equal(successes / n * n, successes)
+        endog, p = successes / n, self.p[[2, 8, 10, 16]]
+        numpy.testing.assert_allclose(
+            _log_binom_coef(endog, n), gammaln_coef(successes, n), rtol=1e-12
+        )
+        fam = Binomial()
+        fam.n = n
+        expected = stats.binom.logpmf(successes, n, p).sum()
+        assert pytest.approx(fam.loglike(endog, p), rel=1e-12) == expected
+        # a non-integer count leaves every observation to gammaln
+        endog = numpy.array([1.0, 2.5, 0.0, 4.0]) / n
+        numpy.testing.assert_array_equal(
+            _log_binom_coef(endog, n), gammaln_coef(endog * n, n)
+        )
+
+    def test_freq_weights(self):
+        y, mu = self.y[:, :2], self.mu[:, :2]
+        fw = self.rng.integers(1, 4, (50, 1)).astype(float)
+        for fam in [Poisson(), Gamma(), Gaussian()]:
+            dev = fam.deviance(y, mu, fw, axis=0)
+            # integer weights act as repeated observations
+            rep = numpy.repeat(numpy.arange(50), fw[:, 0].astype(int))
+            for j in range(2):
+                yj, muj = y[:, j], mu[:, j]
+                assert pytest.approx(dev[j]) == fam.deviance(yj[rep], muj[rep])
+                assert pytest.approx(dev[j]) == fam.deviance(yj, muj, fw[:, 0])
+
+    def test_mutated_endog(self):
+        mu = numpy.full(4, 2.0)
+        for fam in [Poisson(), Gamma()]:
+            y = numpy.arange(1.0, 5.0)
+            fam.loglike(y, mu)
+            fam.deviance(y, mu)
+            y[:] = [5, 6, 7, 8]
+            fresh = type(fam)()
+            assert pytest.approx(fam.loglike(y, mu)) == fresh.loglike(y.copy(), mu)
+            assert pytest.approx(fam.deviance(y, mu)) == fresh.deviance(y.copy(), mu)
+
+    def test_binomial_subclass(self):
+        class Custom(Binomial):
+            def loglike(self, endog, mu, freq_weights=1, scale=1.0, axis=None):
+                return 0.0
+
+        y, p = numpy.array([0.0, 1.0, 1.0]), self.p[:3]
+        assert Custom().loglike(y, p) == 0.0
+        fam = Binomial()
+        n = numpy.array([2.0, 3.0, 4.0])
+        fam.n = n
+        expected = stats.binom.logpmf(y * n, n, p).sum()
+        assert pytest.approx(fam.loglike(y, p)) == expected
+        fam.n = 1
+        assert pytest.approx(fam.loglike(y, p)) == stats.bernoulli.logpmf(y, p).sum()
+
+    def test_extended_links(self):
+        class Extended(Poisson):
+            links = list(Poisson.links)
+
+        Extended.links.append(links.Power)
+        assert isinstance(Extended(links.Power).link, links.Power)
+        with pytest.raises(ValueError):
+            Poisson(links.Power)
+
+    def test_axis_scale(self):
+        y, mu = self.y, self.mu
+        scale = numpy.array([0.5, 1.0, 2.0])
+        for fam in [Gamma(), Gaussian(links.log)]:
+            llf = fam.loglike(y, mu, scale=scale, axis=0)
+            for j in range(3):
+                expected = fam.loglike(y[:, j], mu[:, j], scale=scale[j])
+                assert pytest.approx(llf[j]) == expected
+
+    def test_integer_inputs(self):
+        endog, mu = numpy.array([1, 2, 4]), numpy.array([2, 2, 3])
+        fam = Gamma()
+        assert pytest.approx(fam.deviance(endog, mu)) == 0.4775968828829955
+        numpy.testing.assert_allclose(
+            fam.resid_dev(endog, mu), fam.resid_dev(endog * 1.0, mu * 1.0)
+        )
+        numpy.testing.assert_array_equal(
+            Gaussian().resid_dev(numpy.array([1, 2]), numpy.array([1, 3])), [0.0, -1.0]
+        )
+        fw = numpy.array([[0.5], [1.5]])
+        dev = Gaussian().deviance(numpy.array([[1], [2]]), numpy.array([[0], [4]]), fw)
+        assert dev == pytest.approx(6.5)
+
+    def test_negative_binomial_link(self):
+        link = links.NegativeBinomial(alpha=0.7)
+        p = numpy.array([1e-6, 0.1, 2.0, 50.0, 1e6, 1e10, 1e17])
+        numpy.testing.assert_allclose(link.inverse(link(p)), p, rtol=1e-12)
+        moderate = p[:4]
+        numpy.testing.assert_allclose(
+            link(moderate),
+            numpy.log(moderate / (moderate + 1 / link.alpha)),
+            rtol=1e-12,
+        )
+        # log(p / (p + 1/alpha)) ~ -1 / (alpha * p), which the direct ratio
+        # rounds to 0 at p = 1e17
+        assert link(1e17) == pytest.approx(-1 / (0.7 * 1e17), rel=1e-12)
+
+    def test_gamma_anscombe_negative(self):
+        resid = Gamma().resid_anscombe(
+            numpy.array([1.0, 1.0, -1.0, 8.0]), numpy.array([-1.0, 1.0, 1.0, 1.0])
+        )
+        numpy.testing.assert_array_equal(resid, [numpy.nan, 0.0, numpy.nan, 3.0])
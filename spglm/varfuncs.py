@@ -260,7 +260,7 @@ class NegativeBinomial:
         self.alpha = alpha
 
     def _clean(self, p):
-        return np.clip(p, FLOAT_EPS, np.inf)
+        return np.maximum(p, FLOAT_EPS)
 
     def __call__(self, mu):
         """